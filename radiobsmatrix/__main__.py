@@ -4,6 +4,11 @@ from radiobsmatrix import main
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        from uvloop import run
+    except ImportError:
+        run = asyncio.run
+
+    try:
+        run(main())
     except KeyboardInterrupt:
         pass
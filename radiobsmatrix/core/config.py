@@ -1,7 +1,12 @@
 import os
-from functools import lru_cache
+import tomllib
+from collections.abc import Callable, Mapping
+from functools import lru_cache, partial
+from importlib.resources.abc import Traversable
+from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+from pydantic.fields import FieldInfo
 from pydantic_settings import (
     BaseSettings,
     EnvSettingsSource,
@@ -10,10 +15,93 @@ from pydantic_settings import (
     YamlConfigSettingsSource,
 )
 
+from typing import Any, Literal
+
 TOML_FILE_PATH = os.environ.get("TOML_FILE_PATH", "config.toml")
 YAML_FILE_PATH = os.environ.get("YAML_FILE_PATH", "config.yaml")
 
 
+def _parse_toml(file_path: Path | Traversable) -> dict[str, Any]:
+    with file_path.open("rb") as toml_file:
+        return tomllib.load(toml_file)
+
+
+def _parse_yaml(file_path: Path | Traversable, encoding: str | None) -> dict[str, Any]:
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    with file_path.open(encoding=encoding) as yaml_file:
+        return yaml.load(yaml_file, Loader=SafeLoader) or {}
+
+
+@lru_cache(maxsize=4)
+def _load_toml(file_path: Path, mtime_ns: int) -> dict[str, Any]:
+    return _parse_toml(file_path)
+
+
+@lru_cache(maxsize=4)
+def _load_yaml(file_path: Path, mtime_ns: int, encoding: str | None) -> dict[str, Any]:
+    return _parse_yaml(file_path, encoding)
+
+
+class CachedTomlConfigSettingsSource(TomlConfigSettingsSource):
+    def _read_file(self, file_path: Path | Traversable) -> dict[str, Any]:
+        if not isinstance(file_path, Path):
+            return _parse_toml(file_path)
+        return _load_toml(file_path, file_path.stat().st_mtime_ns)
+
+
+class CachedYamlConfigSettingsSource(YamlConfigSettingsSource):
+    def _read_file(self, file_path: Path | Traversable) -> dict[str, Any]:
+        if not isinstance(file_path, Path):
+            return _parse_yaml(file_path, self.yaml_file_encoding)
+        return _load_yaml(
+            file_path, file_path.stat().st_mtime_ns, self.yaml_file_encoding
+        )
+
+
+def _is_complete(model: type[BaseModel], state: Mapping[str, Any]) -> bool:
+    for name, field in model.model_fields.items():
+        if name not in state:
+            return False
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            value = state[name]
+            if isinstance(value, Mapping) and not _is_complete(annotation, value):
+                return False
+    return True
+
+
+class LazySettingsSource(PydanticBaseSettingsSource):
+    """
+    Build the wrapped source only if the previous sources left a field unset.
+    """
+
+    def __init__(
+        self,
+        settings_cls: type[BaseSettings],
+        factory: Callable[[type[BaseSettings]], PydanticBaseSettingsSource],
+    ) -> None:
+        super().__init__(settings_cls)
+        self.factory = factory
+
+    def get_field_value(self, field: FieldInfo, field_name: str) -> tuple[Any, str, bool]:
+        return None, field_name, False
+
+    def __call__(self) -> dict[str, Any]:
+        if _is_complete(self.settings_cls, self.current_state):
+            return {}
+        return self.factory(self.settings_cls)()
+
+
+_TOML_SOURCE = partial(CachedTomlConfigSettingsSource, toml_file=TOML_FILE_PATH)
+_YAML_SOURCE = partial(CachedYamlConfigSettingsSource, yaml_file=YAML_FILE_PATH)
+
+
 class MatrixSettings(BaseModel):
     homeserver: str = Field(
         description="Matrix homeserver URL", default="https://matrix.org"
@@ -40,16 +128,23 @@ class RadioSettings(BaseModel):
 
 
 class Settings(BaseSettings):
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
+        description="Logging level", default="INFO"
+    )
     matrix: MatrixSettings = Field(default_factory=MatrixSettings)
     radio: RadioSettings = Field(default_factory=RadioSettings)
 
+    @field_validator("log_level", mode="before")
+    @classmethod
+    def upper_log_level(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return value.upper()
+        return value
+
     @classmethod
     def settings_customise_sources(  # type: ignore[override]
         cls, settings_cls: type[BaseSettings], **kwargs
     ) -> tuple[PydanticBaseSettingsSource, ...]:
-        global TOML_FILE_PATH
-        global YAML_FILE_PATH
-
         return (
             EnvSettingsSource(
                 settings_cls,
@@ -57,8 +152,8 @@ class Settings(BaseSettings):
                 env_nested_delimiter="__",
                 case_sensitive=False,
             ),
-            TomlConfigSettingsSource(settings_cls, toml_file=TOML_FILE_PATH),
-            YamlConfigSettingsSource(settings_cls, yaml_file=YAML_FILE_PATH),
+            LazySettingsSource(settings_cls, _TOML_SOURCE),
+            LazySettingsSource(settings_cls, _YAML_SOURCE),
         )
 
 
@@ -1,51 +1,22 @@
 import asyncio
 import logging
-
-import httpx
-from nio import (
-    AsyncClient,
-    JoinError,
-    LoginError,
-    RoomResolveAliasError,
-    RoomSendError,
-)
-from pydantic import BaseModel, model_validator
+from functools import partial
 
 from radiobsmatrix.core.config import get_settings
-
-from typing import Any
-
-
-class RadioStatus(BaseModel):
-    encoder: str | None = None
-    filename: str | None = None
-    initial_uri: str | None = None
-    language: str | None = None
-    rid: str | None = None
-    status: str | None = None
-    temporary: str | None = None
-    title: str | None = None
-    vendor: str | None = None
-
-    @model_validator(mode="before")
-    @classmethod
-    def parse_list(cls, data: Any) -> Any:
-        if isinstance(data, list):
-            return {
-                item[0]: item[1]
-                for item in data
-                if isinstance(item, list) and len(item) == 2
-            }
-        return data
+from radiobsmatrix.core.status import derive_title, parse_status
 
 
 async def main() -> None:
+    settings = get_settings()
+
     logging.basicConfig(
-        level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
+        level=settings.log_level,
+        format="%(asctime)s - %(levelname)s - %(message)s",
     )
+    for noisy_logger in ("httpx", "httpcore", "nio"):
+        logging.getLogger(noisy_logger).setLevel(logging.WARNING)
     logger = logging.getLogger("radiobsmatrix")
 
-    settings = get_settings()
     matrix_homeserver = settings.matrix.homeserver
     matrix_user = settings.matrix.user
     matrix_password = settings.matrix.password
@@ -55,13 +26,22 @@ async def main() -> None:
     radio_api_url = settings.radio.api_url
     poll_interval = settings.radio.poll_interval
 
-    if not all([matrix_user, matrix_password, matrix_room_id, radio_api_url]):
+    if not (matrix_user and matrix_password and matrix_room_id and radio_api_url):
         logger.error(
             "Missing required config! Set MATRIX_USER, MATRIX_PASSWORD, MATRIX_ROOM_ID, "
             "and RADIO_API_URL environment variables."
         )
         return
 
+    import httpx
+    from nio import (
+        AsyncClient,
+        JoinError,
+        LoginError,
+        RoomResolveAliasError,
+        RoomSendError,
+    )
+
     logger.info("Initializing matrix client...")
     client = AsyncClient(matrix_homeserver, matrix_user)
 
@@ -69,7 +49,7 @@ async def main() -> None:
         logger.info("Logging in to matrix...")
         login_res = await client.login(matrix_password)
         if isinstance(login_res, LoginError):
-            logger.error(f"Failed to log in to Matrix: {login_res.message}")
+            logger.error("Failed to log in to Matrix: %s", login_res.message)
             await client.close()
             return
 
@@ -80,7 +60,7 @@ async def main() -> None:
             resolve_res = await client.room_resolve_alias(matrix_room_id)
             if isinstance(resolve_res, RoomResolveAliasError):
                 logger.error(
-                    f"Failed to resolve room {matrix_room_id}: {resolve_res.message}"
+                    "Failed to resolve room %s: %s", matrix_room_id, resolve_res.message
                 )
                 await client.logout()
                 await client.close()
@@ -91,36 +71,85 @@ async def main() -> None:
         logger.info("Joining target room %s...", matrix_room_id)
         join_res = await client.join(matrix_room_id)
         if isinstance(join_res, JoinError):
-            logger.error(f"Failed to join room {matrix_room_id}: {join_res.message}")
+            logger.error("Failed to join room %s: %s", matrix_room_id, join_res.message)
             await client.logout()
             await client.close()
             return
     except Exception as e:
-        logger.error(f"Failed to log in to Matrix: {e}")
+        logger.error("Failed to log in to Matrix: %s", e)
         await client.close()
         return
 
     current_title = None
+    last_raw: bytes | None = None
+    conditional_headers: dict[str, str] = {}
+    message_skeleton = {"msgtype": "m.text", "format": "org.matrix.custom.html"}
+    topic_prefix = (
+        f'[{settings.radio.name}]({settings.radio.stream_url}) - 🎵 Now playing: '
+    )
+    send_message = partial(
+        client.room_send, room_id=matrix_room_id, message_type="m.room.message"
+    )
+    put_topic = partial(
+        client.room_put_state, room_id=matrix_room_id, event_type="m.room.topic"
+    )
 
-    async with httpx.AsyncClient() as http_client:
+    async def send_now_playing(song_title: str) -> None:
+        message = f'🎵 Now playing: **{song_title}**'
+        send_res = await send_message(
+            content={
+                **message_skeleton,
+                "body": message,
+                "formatted_body": message,
+            },
+        )
+        if isinstance(send_res, RoomSendError):
+            logger.error("Failed to send message: %s", send_res.message)
+
+    async def update_topic(song_title: str) -> None:
+        content = {"topic": topic_prefix + song_title}
+        topic_res = await put_topic(content=content)
+        if hasattr(topic_res, "message"):
+            logger.error("Failed to update room topic: %s", topic_res.message)
+        else:
+            logger.info("Room topic updated to: %s", content["topic"])
+
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=1,
+            keepalive_expiry=max(60.0, poll_interval * 2.0),
+        ),
+        timeout=httpx.Timeout(10.0, connect=5.0),
+    ) as http_client:
         try:
             logger.info(
                 "Starting to poll API (%s) every %ds.", radio_api_url, poll_interval
             )
             while True:
                 try:
-                    response = await http_client.get(radio_api_url, timeout=10.0)
+                    response = await http_client.get(
+                        radio_api_url, headers=conditional_headers
+                    )
+                    if response.status_code == httpx.codes.NOT_MODIFIED:
+                        await asyncio.sleep(poll_interval)
+                        continue
                     response.raise_for_status()
+                    validators = {}
+                    if etag := response.headers.get("etag"):
+                        validators["If-None-Match"] = etag
+                    if last_modified := response.headers.get("last-modified"):
+                        validators["If-Modified-Since"] = last_modified
 
-                    data = response.json()
-                    status = RadioStatus.model_validate(data)
+                    raw = await response.aread()
+                    if raw == last_raw:
+                        conditional_headers = validators
+                        await asyncio.sleep(poll_interval)
+                        continue
 
-                    song_title = status.title
-                    if not song_title:
-                        if status.filename:
-                            song_title = status.filename.split("/")[-1].replace("_", " ")
-                        else:
-                            song_title = "Unknown Song"
+                    status = parse_status(raw)
+
+                    song_title = derive_title(status.get("title"), status.get("filename"))
 
                     if song_title and song_title != current_title:
                         if current_title is not None:
@@ -128,41 +157,31 @@ async def main() -> None:
                         else:
                             logger.info("📻 Initial song: %s", song_title)
 
+                        updates = []
                         if matrix_send_messages:
-                            message = f'🎵 Now playing: **{song_title}**'
-                            send_res = await client.room_send(
-                                room_id=matrix_room_id,
-                                message_type="m.room.message",
-                                content={
-                                    "msgtype": "m.text",
-                                    "format": "org.matrix.custom.html",
-                                    "body": message,
-                                    "formatted_body": message,
-                                },
-                            )
-                            if isinstance(send_res, RoomSendError):
-                                logger.error(
-                                    f"Failed to send message: {send_res.message}"
-                                )
-
+                            updates.append(send_now_playing(song_title))
                         if matrix_update_topic:
-                            content = {
-                                "topic": f'[{settings.radio.name}]({settings.radio.stream_url}) - 🎵 Now playing: {song_title}',
-                            }
-                            topic_res = await client.room_put_state(
-                                room_id=matrix_room_id,
-                                event_type="m.room.topic",
-                                content=content,
-                            )
-                            if hasattr(topic_res, "message"):
+                            updates.append(update_topic(song_title))
+                        results = await asyncio.gather(*updates, return_exceptions=True)
+                        for result in results:
+                            if isinstance(result, BaseException):
                                 logger.error(
-                                    f"Failed to update room topic: {topic_res.message}"
+                                    "Failed to update Matrix room: %s",
+                                    result,
+                                    exc_info=result,
                                 )
-                            else:
-                                logger.info(f"Room topic updated to: {content['topic']}")
+
+                        # Only the first update (the message when enabled) is retried
+                        # on failure; re-sending a delivered message would spam the room
+                        if results and isinstance(results[0], BaseException):
+                            await asyncio.sleep(poll_interval)
+                            continue
 
                         current_title = song_title
 
+                    last_raw = raw
+                    conditional_headers = validators
+
                 except httpx.HTTPError as e:
                     logger.warning("HTTP error polling API: %s", e)
                 except Exception as e:
@@ -0,0 +1,48 @@
+from pydantic_core import from_json
+
+from typing import Any, TypedDict
+
+
+class RadioStatus(TypedDict, total=False):
+    encoder: str | None
+    filename: str | None
+    initial_uri: str | None
+    language: str | None
+    rid: str | None
+    status: str | None
+    temporary: str | None
+    title: str | None
+    vendor: str | None
+
+
+_WANTED_KEYS = frozenset(("title", "filename"))
+
+
+def _normalize(data: Any) -> Any:
+    if isinstance(data, list):
+        status = {}
+        for item in data:
+            if (
+                isinstance(item, list)
+                and len(item) == 2
+                and item[0] in _WANTED_KEYS
+                and isinstance(item[1], str)
+            ):
+                status[item[0]] = item[1]
+                if len(status) == len(_WANTED_KEYS):
+                    break
+        return status
+    if isinstance(data, dict):
+        return {key: value for key, value in data.items() if isinstance(value, str)}
+    msg = f"Unexpected radio status payload: {type(data).__name__}"
+    raise ValueError(msg)
+
+
+def parse_status(raw: bytes) -> RadioStatus:
+    return _normalize(from_json(raw))
+
+
+def derive_title(title: str | None, filename: str | None) -> str:
+    return title or (
+        filename.rpartition("/")[2].replace("_", " ") if filename else "Unknown Song"
+    )